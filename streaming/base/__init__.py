@@ -1,7 +1,8 @@
 from .dataset import Dataset
-from .format import CSVWriter, JSONWriter, MDSWriter, reader_from_json, TSVWriter, XSVWriter
+from .format import (CSVWriter, JSONWriter, MDSCWriter, MDSWriter, reader_from_json, TSVWriter,
+                     XSVWriter)
 from .local import LocalDataset
 
 
-__all__ = ['Dataset', 'CSVWriter', 'JSONWriter', 'MDSWriter', 'reader_from_json', 'TSVWriter',
-           'XSVWriter', 'LocalDataset']
+__all__ = ['Dataset', 'CSVWriter', 'JSONWriter', 'MDSCWriter', 'MDSWriter', 'reader_from_json',
+           'TSVWriter', 'XSVWriter', 'LocalDataset']
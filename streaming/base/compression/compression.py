@@ -2,10 +2,16 @@ import brotli
 import bz2
 import gzip
 import snappy
+from threading import local
 from typing import Iterator, Optional, Type
 from typing_extensions import Self
 import zstd
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 __all__ = ['compress', 'decompress', 'get_compression_extension', 'get_compressions',
            'is_compression']
@@ -131,7 +137,11 @@ class Snappy(Compression):
 
 
 class Zstandard(LevelledCompression):
-    """Zstandard compression."""
+    """Zstandard compression.
+
+    If the zstandard package is installed, decompression reuses one decompression context per
+    thread instead of setting up a new one for every shard.
+    """
 
     extension = 'zstd'
     levels = list(range(1, 23))
@@ -139,12 +149,18 @@ class Zstandard(LevelledCompression):
     def __init__(self, level: int = 3) -> None:
         assert level in self.levels
         self.level = level
+        self._contexts = local()
 
     def compress(self, data) -> bytes:
         return zstd.compress(data, self.level)
 
     def decompress(self, data: bytes) -> bytes:
-        return zstd.decompress(data)
+        if not zstandard:
+            return zstd.decompress(data)
+        dctx = getattr(self._contexts, 'dctx', None)
+        if dctx is None:
+            self._contexts.dctx = dctx = zstandard.ZstdDecompressor()
+        return dctx.decompress(data)
 
 
 # Compression algorithm families (extension -> class).
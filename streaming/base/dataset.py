@@ -1,5 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
-import json
 from multiprocessing import Pool
 import numpy as np
 import os
@@ -12,8 +12,10 @@ from .compression import decompress
 from . import distributed as dist
 from .download import download_or_wait
 from .format import reader_from_json
-from .hashing import get_hash
+from .format.base.reader import FileTable
+from .hashing import get_file_hash, get_hash
 from .index import get_index_basename, Index, Partition
+from .jsonio import loads
 
 
 class DownloadStatus(IntEnum):
@@ -115,12 +117,14 @@ class Dataset(IterableDataset):
         basename = get_index_basename()
         wait = dist.get_local_rank() != 0
         filename = self._download_file(basename, wait)
-        obj = json.load(open(filename))
+        obj = loads(open(filename, 'rb').read())
         assert obj['version'] == 2
 
+        # Validation info of every shard's files, held in one table which the shards view into.
+        self._files = FileTable()
         self.shards = []
         for info in obj['shards']:
-            shard = reader_from_json(local, split, info)
+            shard = reader_from_json(local, split, info, self._files)
             self.shards.append(shard)
 
         samples_per_shard = list(map(lambda shard: shard.samples, self.shards))
@@ -200,11 +204,16 @@ class Dataset(IterableDataset):
         """
         self._load_shards([shard], partition)
 
-    def _preload_shard(self, shard: int) -> bool:
-        """Attempt to decompress and validate a single shard, returning whether it is present.
+    def _preload_shard(self, shard: int, raw_ids: list[int]) -> bool:
+        """Attempt to decompress a single shard, returning whether it is present.
+
+        Raw files that were already present are not validated here, but collected for validating
+        in bulk afterward.
 
         Args:
             shard (int): Which shard.
+            raw_ids (list[int]): Appended to with the file table IDs of present raw files needing
+                validation.
 
         Returns:
             bool: Whether shard is present.
@@ -214,8 +223,7 @@ class Dataset(IterableDataset):
             raw_filename = os.path.join(self.local, self.split, raw_info.basename)
             if os.path.isfile(raw_filename):
                 if self.hash:
-                    data = open(raw_filename, 'rb').read()
-                    assert get_hash(self.hash, data) == raw_info.hashes[self.hash]
+                    raw_ids.append(raw_info.idx)
             elif not zip_info:
                 return False
             else:
@@ -233,6 +241,26 @@ class Dataset(IterableDataset):
                     return False
         return True
 
+    def _validate_raw_files(self, raw_ids: list[int]) -> None:
+        """Validate the given locally cached raw files against their expected hashes.
+
+        The files are hashed concurrently in a thread pool, as hashing releases the GIL, then
+        checked against the file table's column of expected hashes.
+
+        Args:
+            raw_ids (list[int]): File table IDs of the raw files to validate.
+        """
+        if not self.hash or not raw_ids:
+            return
+        filenames = []
+        for raw_id in raw_ids:
+            filenames.append(os.path.join(self.local, self.split, self._files.basenames[raw_id]))
+        expected = self._files.hashes[self.hash]
+        with ThreadPoolExecutor() as pool:
+            hashes = pool.map(lambda filename: get_file_hash(self.hash, filename), filenames)
+            for raw_id, got in zip(raw_ids, hashes):
+                assert got == expected[raw_id]
+
     def _preload(self, partition: Partition) -> list[int]:
         """Load any shards that are cached locally, returning the list of missing shards.
 
@@ -256,11 +284,13 @@ class Dataset(IterableDataset):
         # Find and load cached shards given our sample range.
         present_shards = []
         missing_shards = []
+        raw_ids = []
         for shard in partition.shards:
-            if self._preload_shard(shard):
+            if self._preload_shard(shard, raw_ids):
                 present_shards.append(shard)
             else:
                 missing_shards.append(shard)
+        self._validate_raw_files(raw_ids)
         self._load_shards(present_shards, partition)
 
         # If there are no missing shards, we're done.
@@ -334,8 +364,7 @@ class Dataset(IterableDataset):
                     wait = shard not in partition.shards_to_download
                     self._download_file(raw_info.basename, wait)
                     if self.hash:
-                        data = open(raw_filename, 'rb').read()
-                        assert get_hash(self.hash, data) == raw_info.hashes[self.hash]
+                        assert get_file_hash(self.hash, raw_filename) == raw_info.hashes[self.hash]
         return shard
 
     def _download_shards_via_pool(self, shards: list[int], partition: Partition,
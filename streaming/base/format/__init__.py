@@ -1,24 +1,28 @@
 from typing import Any, Optional
 
-from .base.reader import Reader
+from .base.reader import FileTable, Reader
 from .json import JSONReader, JSONWriter
 from .mds import MDSReader, MDSWriter
+from .mdsc import MDSCReader, MDSCWriter
 from .xsv import CSVReader, CSVWriter, TSVReader, TSVWriter, XSVReader, XSVWriter
 
 
-_readers = {
-    'csv': CSVReader,
-    'json': JSONReader,
-    'mds': MDSReader,
-    'tsv': TSVReader,
-    'xsv': XSVReader
+# Reader constructors (format name -> from_json classmethod), bound once up front.
+_from_json = {
+    'csv': CSVReader.from_json,
+    'json': JSONReader.from_json,
+    'mds': MDSReader.from_json,
+    'mdsc': MDSCReader.from_json,
+    'tsv': TSVReader.from_json,
+    'xsv': XSVReader.from_json
 }
 
 
-def reader_from_json(dirname: str, split: Optional[str], obj: dict[str, Any]) -> Reader:
+def reader_from_json(dirname: str, split: Optional[str], obj: dict[str, Any],
+                     files: Optional[FileTable] = None) -> Reader:
     assert obj['version'] == 2
-    cls = _readers[obj['format']]
-    return cls.from_json(dirname, split, obj)
+    return _from_json[obj['format']](dirname, split, obj, files)
 
 
-__all__ = ['CSVWriter', 'JSONWriter', 'MDSWriter', 'reader_from_json', 'TSVWriter', 'XSVWriter']
+__all__ = ['CSVWriter', 'JSONWriter', 'MDSCWriter', 'MDSWriter', 'reader_from_json', 'TSVWriter',
+           'XSVWriter']
@@ -1,19 +1,105 @@
-from dataclasses import dataclass
-from typing import Any, Iterator, Optional
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import os
+from threading import local
+from typing import Any, BinaryIO, Iterator, Optional, Union
+
+
+class FileTable(object):
+    """File validation info of many files, stored as parallel columns.
+
+    Files are appended as shards are loaded from the index, each yielding a FileInfo view of its
+    row, so the fields are stored once here rather than on per-file objects.
+    """
+
+    def __init__(self) -> None:
+        self.basenames = []
+        self.bytes = array('q')
+        self.hashes = {}
+
+    def __len__(self) -> int:
+        """Get the number of files.
+
+        Returns:
+            int: File count.
+        """
+        return len(self.basenames)
+
+    def append(self, basename: str, bytes: int, hashes: dict[str, str]) -> 'FileInfo':
+        """Add a file's validation info.
+
+        Args:
+            basename (str): File basename.
+            bytes (int): File size in bytes.
+            hashes (dict[str, str]): Mapping of hash algorithm to hash value.
+
+        Returns:
+            FileInfo: View of the file's row.
+        """
+        idx = len(self.basenames)
+        self.basenames.append(basename)
+        self.bytes.append(bytes)
+        for algo, value in hashes.items():
+            if algo not in self.hashes:
+                self.hashes[algo] = [None] * idx
+            self.hashes[algo].append(value)
+        for values in self.hashes.values():
+            if len(values) == idx:
+                values.append(None)
+        return FileInfo(self, idx)
 
 
-@dataclass
 class FileInfo(object):
-    """File validation info.
+    """File validation info, as a view of one row of a FileTable.
 
     Args:
-        basename (str): File basename.
-        bytes (int): File size in bytes.
-        hashes (dict[str, str]): Mapping of hash algorithm to hash value.
+        table (FileTable): Table holding the file's fields.
+        idx (int): Row of the file in the table.
     """
-    basename: str
-    bytes: int
-    hashes: dict[str, str]
+
+    __slots__ = ('table', 'idx')
+
+    def __init__(self, table: FileTable, idx: int) -> None:
+        self.table = table
+        self.idx = idx
+
+    @property
+    def basename(self) -> str:
+        """Get the file basename.
+
+        Returns:
+            str: File basename.
+        """
+        return self.table.basenames[self.idx]
+
+    @property
+    def hashes(self) -> dict[str, str]:
+        """Get the file hashes.
+
+        Returns:
+            dict[str, str]: Mapping of hash algorithm to hash value.
+        """
+        hashes = {}
+        for algo, values in self.table.hashes.items():
+            if values[self.idx] is not None:
+                hashes[algo] = values[self.idx]
+        return hashes
+
+    @property
+    def bytes(self) -> int:
+        """Get the file size.
+
+        Returns:
+            int: File size in bytes.
+        """
+        return self.table.bytes[self.idx]
+
+
+# Per-thread scratch buffers which sample data is read into, to avoid allocating per sample.
+_buffers = local()
 
 
 class Reader(object):
@@ -55,25 +141,66 @@ class Reader(object):
         """
         return self.samples
 
-    def _decode_sample(self, data: bytes) -> dict[str, Any]:
+    def _decode_sample(self, data: Union[bytes, memoryview]) -> dict[str, Any]:
         """Decode a sample dict from bytes.
 
         Args:
-            data (bytes): The sample encoded as bytes.
+            data (Union[bytes, memoryview]): The sample encoded as bytes.
 
         Returns:
             dict[str, Any]: Sample dict.
         """
         raise NotImplementedError
 
-    def _get_sample_data(self, idx: int) -> bytes:
+    def _decode_lazy_sample(self, data: Union[bytes, memoryview]) -> Mapping[str, Any]:
+        """Wrap sample bytes in a mapping which decodes each field on first access.
+
+        Formats which cannot decode fields individually decode the whole sample up front.
+
+        Args:
+            data (Union[bytes, memoryview]): The sample encoded as bytes.
+
+        Returns:
+            Mapping[str, Any]: Sample mapping.
+        """
+        return self._decode_sample(data)
+
+    def _open(self) -> None:
+        """Prepare for reading samples, if this format needs to (e.g., load sample offsets)."""
+        pass
+
+    def _read_into_buffer(self, fp: BinaryIO, size: int) -> memoryview:
+        """Read from a file into this thread's scratch buffer, growing it if needed.
+
+        The returned view is only valid until the next read on this thread.
+
+        Args:
+            fp (BinaryIO): File to read from.
+            size (int): Number of bytes to read.
+
+        Returns:
+            memoryview: View of the data read.
+        """
+        buf = getattr(_buffers, 'buf', None)
+        if buf is None or len(buf) < size:
+            _buffers.buf = buf = bytearray(size)
+        view = memoryview(buf)[:size]
+        count = fp.readinto(view)
+        if count != size:
+            raise IOError(f'Expected to read {size} bytes from {fp.name}, got {count}.')
+        return view
+
+    def _get_sample_data(self, idx: int) -> Union[bytes, memoryview]:
         """Get the raw sample data at the index.
 
+        If a memoryview is returned, it may point into a reused buffer, so it must be decoded (or
+        copied) before the next sample is read on this thread.
+
         Args:
             idx (int): Sample index.
 
         Returns:
-            bytes: Sample data.
+            Union[bytes, memoryview]: Sample data.
         """
         raise NotImplementedError
 
@@ -89,6 +216,31 @@ class Reader(object):
         data = self._get_sample_data(idx)
         return self._decode_sample(data)
 
+    def get_lazy(self, idx: int) -> Mapping[str, Any]:
+        """Get the sample at the index, decoding its fields only as they are accessed.
+
+        Args:
+            idx (int): Sample index.
+
+        Returns:
+            Mapping[str, Any]: Sample mapping.
+        """
+        data = self._get_sample_data(idx)
+        return self._decode_lazy_sample(data)
+
+    def get_batch(self, indices: list[int]) -> list[dict[str, Any]]:
+        """Get the samples at the given indices.
+
+        Subclasses may override this to fetch the samples in a single sweep over the shard.
+
+        Args:
+            indices (list[int]): Sample indices.
+
+        Returns:
+            list[dict[str, Any]]: Sample dicts, in the order requested.
+        """
+        return [self[idx] for idx in indices]
+
     def __iter__(self) -> Iterator[dict[str, Any]]:
         """Iterate over the samples of this shard.
 
@@ -98,6 +250,41 @@ class Reader(object):
         for i in range(len(self)):
             yield self[i]
 
+    def _get_owned_sample_data(self, idx: int) -> bytes:
+        """Get the raw sample data at the index, copied out of any reused buffer.
+
+        Args:
+            idx (int): Sample index.
+
+        Returns:
+            bytes: Sample data.
+        """
+        return bytes(self._get_sample_data(idx))
+
+    def iter_prefetched(self, prefetch: int = 32) -> Iterator[dict[str, Any]]:
+        """Iterate over the samples of this shard, reading ahead in background threads.
+
+        Sample data is read up to ``prefetch`` samples ahead while the current sample is decoded.
+
+        Args:
+            prefetch (int, default: 32): How many samples to read ahead. If 0, reads serially.
+
+        Returns:
+            Iterator[dict[str, Any]]: Iterator over samples.
+        """
+        if not prefetch:
+            yield from self
+            return
+        self._open()
+        with ThreadPoolExecutor(prefetch) as pool:
+            futures = deque()
+            for i in range(len(self)):
+                futures.append(pool.submit(self._get_owned_sample_data, i))
+                if prefetch < len(futures):
+                    yield self._decode_sample(futures.popleft().result())
+            while futures:
+                yield self._decode_sample(futures.popleft().result())
+
 
 class JointReader(Reader):
     """Provides random access to the samples of a joint shard.
@@ -129,6 +316,8 @@ class JointReader(Reader):
         self.zip_data = zip_data
         self.file_pairs.append((raw_data, zip_data))
 
+        self._data_filename = os.path.join(self.dirname, self.split, raw_data.basename)
+
 
 class SplitReader(Reader):
     """Provides random access to the samples of a split shard.
@@ -166,3 +355,18 @@ class SplitReader(Reader):
         self.zip_meta = zip_meta
         self.file_pairs.append((raw_meta, zip_meta))
         self.file_pairs.append((raw_data, zip_data))
+
+        self._data_filename = os.path.join(self.dirname, self.split, raw_data.basename)
+        self._meta_filename = os.path.join(self.dirname, self.split, raw_meta.basename)
+
+        # Sample offsets into the data file, loaded from the meta file on first sample access (the
+        # files may not be downloaded yet at construction).
+        self._offsets = None
+
+    def _open(self) -> None:
+        if self._offsets is not None:
+            return
+        with open(self._meta_filename, 'rb', 0) as fp:
+            fp.seek(4)
+            data = fp.read((self.samples + 1) * 4)
+        self._offsets = np.frombuffer(data, np.uint32)
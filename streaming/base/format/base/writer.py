@@ -1,12 +1,12 @@
-import json
 import os
 from types import TracebackType
 from typing import Any, Optional, Type
 from typing_extensions import Self
 
 from ...compression import compress, get_compression_extension, is_compression
-from ...hashing import get_hash, is_hash
+from ...hashing import get_hash_of_parts, is_hash
 from ...index import get_index_basename
+from ...jsonio import dumps
 
 
 class Writer(object):
@@ -104,11 +104,11 @@ class Writer(object):
             zip_basename = None
         return raw_basename, zip_basename
 
-    def _hash(self, data: bytes, basename: str) -> dict[str, Any]:
+    def _hash(self, parts: list[bytes], basename: str) -> dict[str, Any]:
         """Generate file metadata.
 
         Args:
-            data (bytes): The file data.
+            parts (list[bytes]): The file data, in pieces.
             basename (str): The file's basename.
 
         Returns:
@@ -116,38 +116,40 @@ class Writer(object):
         """
         hashes = {}
         for algo in self.hashes:
-            hashes[algo] = get_hash(algo, data)
+            hashes[algo] = get_hash_of_parts(algo, parts)
         return {
             'basename': basename,
-            'bytes': len(data),
+            'bytes': sum(map(len, parts)),
             'hashes': hashes
         }
 
-    def _process_file(self, raw_data: bytes, raw_basename: str,
+    def _process_file(self, raw_parts: list[bytes], raw_basename: str,
                       zip_basename: Optional[str]) -> tuple[dict, Optional[dict]]:
         """Process and save a shard file (hash, compress, hash, write).
 
+        The uncompressed file is written piece by piece, so its data is never concatenated.
+
         Args:
-            raw_data (bytes): Uncompressed data.
+            raw_parts (list[bytes]): Uncompressed data, in pieces.
             raw_basename (str): Uncompressed basename.
             zip_basename (str): Compressed basename.
 
         Returns:
             dict[str, Any]: Metadata containing basename, size, and hashes.
         """
-        raw_info = self._hash(raw_data, raw_basename)
+        raw_info = self._hash(raw_parts, raw_basename)
         if zip_basename:
-            zip_data = compress(self.compression, raw_data)
-            zip_info = self._hash(zip_data, zip_basename)
-            data = zip_data
+            zip_data = compress(self.compression, b''.join(raw_parts))
+            parts = [zip_data]
+            zip_info = self._hash(parts, zip_basename)
             basename = zip_basename
         else:
             zip_info = None
-            data = raw_data
+            parts = raw_parts
             basename = raw_basename
         filename = os.path.join(self.dirname, basename)
         with open(filename, 'wb') as out:
-            out.write(data)
+            out.writelines(parts)
         return raw_info, zip_info
 
     def _get_config(self) -> dict[str, Any]:
@@ -187,8 +189,8 @@ class Writer(object):
             'version': 2,
             'shards': self.shards,
         }
-        with open(filename, 'w') as out:
-            json.dump(obj, out, sort_keys=True)
+        with open(filename, 'wb') as out:
+            out.write(dumps(obj))
 
     def finish(self) -> None:
         """Finish writing samples."""
@@ -246,11 +248,11 @@ class JointWriter(Writer):
         super().__init__(dirname, compression, hashes, size_limit, extra_bytes_per_shard,
                          extra_bytes_per_sample)
 
-    def _encode_joint_shard(self) -> bytes:
+    def _encode_joint_shard(self) -> list[bytes]:
         """Encode a joint shard out of the cached samples (single file).
 
         Returns:
-            bytes: File data.
+            list[bytes]: File data, in pieces.
         """
         raise NotImplementedError
 
@@ -295,11 +297,11 @@ class SplitWriter(Writer):
         super().__init__(dirname, compression, hashes, size_limit, self.extra_bytes_per_shard,
                          self.extra_bytes_per_sample)
 
-    def _encode_split_shard(self) -> tuple[bytes, bytes]:
+    def _encode_split_shard(self) -> tuple[list[bytes], list[bytes]]:
         """Encode a split shard out of the cached samples (data file, meta file).
 
         Returns:
-            tuple[bytes, bytes]: Data file, meta file.
+            tuple[list[bytes], list[bytes]]: Data file, meta file, each in pieces.
         """
         raise NotImplementedError
 
@@ -1,11 +1,8 @@
-from copy import deepcopy
 import json
-import numpy as np
-import os
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from typing_extensions import Self
 
-from ..base.reader import FileInfo, SplitReader
+from ..base.reader import FileInfo, FileTable, SplitReader
 
 
 '''
@@ -101,32 +98,29 @@ class JSONReader(SplitReader):
         self.newline = newline
 
     @classmethod
-    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any]) -> Self:
-        args = deepcopy(obj)
-        assert args['version'] == 2
+    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any],
+                  files: Optional[FileTable] = None) -> Self:
+        assert obj['version'] == 2
+        assert obj['format'] == 'json'
+        args = dict(obj)
         del args['version']
-        assert args['format'] == 'json'
         del args['format']
         args['dirname'] = dirname
         args['split'] = split
+        if files is None:
+            files = FileTable()
         for key in ['raw_data', 'raw_meta', 'zip_data', 'zip_meta']:
             arg = args[key]
-            args[key] = FileInfo(**arg) if arg else None
+            args[key] = files.append(**arg) if arg else None
         return cls(**args)
 
-    def _decode_sample(self, data: bytes) -> dict[str, Any]:
-        text = data.decode('utf-8')
+    def _decode_sample(self, data: Union[bytes, memoryview]) -> dict[str, Any]:
+        text = str(data, 'utf-8')
         return json.loads(text)
 
-    def _get_sample_data(self, idx: int) -> bytes:
-        meta_filename = os.path.join(self.dirname, self.split, self.raw_meta.basename)
-        offset = (1 + idx) * 4
-        with open(meta_filename, 'rb', 0) as fp:
-            fp.seek(offset)
-            pair = fp.read(8)
-            begin, end = np.frombuffer(pair, np.uint32)
-        data_filename = os.path.join(self.dirname, self.split, self.raw_data.basename)
-        with open(data_filename, 'rb', 0) as fp:
+    def _get_sample_data(self, idx: int) -> memoryview:
+        self._open()
+        begin, end = self._offsets[idx:idx + 2].tolist()
+        with open(self._data_filename, 'rb', 0) as fp:
             fp.seek(begin)
-            data = fp.read(end - begin)
-        return data
+            return self._read_into_buffer(fp, end - begin)
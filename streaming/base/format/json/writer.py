@@ -2,6 +2,7 @@ import json
 import numpy as np
 from typing import Any, Optional
 
+from ...jsonio import dumps
 from ..base.writer import SplitWriter
 from .encodings import is_json_encoded, is_json_encoding
 
@@ -43,14 +44,14 @@ class JSONWriter(SplitWriter):
         })
         return obj
 
-    def _encode_split_shard(self) -> tuple[bytes, bytes]:
-        data = b''.join(self.new_samples)
+    def _encode_split_shard(self) -> tuple[list[bytes], list[bytes]]:
+        data = self.new_samples
 
         num_samples = np.uint32(len(self.new_samples))
-        sizes = list(map(len, self.new_samples))
-        offsets = np.array([0] + sizes).cumsum().astype(np.uint32)
+        offsets = np.zeros(num_samples + 1, np.uint32)
+        offsets[1:] = np.fromiter(map(len, self.new_samples), np.uint32, num_samples)
+        np.cumsum(offsets, out=offsets)
         obj = self._get_config()
-        text = json.dumps(obj, sort_keys=True)
-        meta = num_samples.tobytes() + offsets.tobytes() + text.encode('utf-8')
+        meta = [num_samples.tobytes(), offsets.tobytes(), dumps(obj)]
 
         return data, meta
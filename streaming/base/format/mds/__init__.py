@@ -1,5 +1,5 @@
-from .reader import MDSReader
+from .reader import LazySample, MDSReader
 from .writer import MDSWriter
 
 
-__all__ = ['MDSReader', 'MDSWriter']
+__all__ = ['LazySample', 'MDSReader', 'MDSWriter']
@@ -3,7 +3,7 @@ import json
 import numpy as np
 from PIL import Image
 import pickle
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 
 __all__ = ['get_mds_encodings', 'is_mds_encoding', 'mds_encode', 'mds_decode',
@@ -26,11 +26,13 @@ class Encoding(object):
         """
         raise NotImplementedError
     
-    def decode(self, data: bytes) -> Any:
+    def decode(self, data: Union[bytes, memoryview]) -> Any:
         """Decode the given data from bytes to the original object.
 
+        The data may be a memoryview into a reused buffer, so the result must not reference it.
+
         Args:
-            data (bytes): Encoded data.
+            data (Union[bytes, memoryview]): Encoded data.
 
         Returns:
             Any: Decoded object.
@@ -44,8 +46,8 @@ class Bytes(Encoding):
     def encode(self, obj: Any) -> bytes:
         return obj
 
-    def decode(self, data: bytes) -> Any:
-        return data
+    def decode(self, data: Union[bytes, memoryview]) -> bytes:
+        return bytes(data)
 
 
 class Str(Encoding):
@@ -54,8 +56,8 @@ class Str(Encoding):
     def encode(self, obj: str) -> bytes:
         return obj.encode('utf-8')
 
-    def decode(self, data: bytes) -> str:
-        return data.decode('utf-8')
+    def decode(self, data: Union[bytes, memoryview]) -> str:
+        return str(data, 'utf-8')
 
 
 class Int(Encoding):
@@ -66,7 +68,7 @@ class Int(Encoding):
     def encode(self, obj: int) -> bytes:
         return np.int64(obj).tobytes()
 
-    def decode(self, data: bytes) -> int:
+    def decode(self, data: Union[bytes, memoryview]) -> int:
         return int(np.frombuffer(data, np.int64)[0])
 
 
@@ -83,11 +85,11 @@ class PIL(Encoding):
         ints = np.array([width, height, len(mode)], np.uint32) 
         return ints.tobytes() + mode + raw
 
-    def decode(self, data: bytes) -> Image.Image:
+    def decode(self, data: Union[bytes, memoryview]) -> Image.Image:
         idx = 3 * 4
         width, height, mode_size = np.frombuffer(data[:idx], np.uint32)
         idx2 = idx + mode_size
-        mode = data[idx:idx2].decode('utf-8')
+        mode = str(data[idx:idx2], 'utf-8')
         size = width, height
         raw = data[idx2:]
         return Image.frombytes(mode, size, raw)  # pyright: ignore
@@ -101,7 +103,7 @@ class JPEG(Encoding):
         obj.save(out, format='JPEG')
         return out.getvalue()
 
-    def decode(self, data: bytes) -> Image.Image:
+    def decode(self, data: Union[bytes, memoryview]) -> Image.Image:
         inp = BytesIO(data)
         return Image.open(inp)
         
@@ -114,7 +116,7 @@ class PNG(Encoding):
         obj.save(out, format='PNG')
         return out.getvalue()
 
-    def decode(self, data: bytes) -> Image.Image:
+    def decode(self, data: Union[bytes, memoryview]) -> Image.Image:
         inp = BytesIO(data)
         return Image.open(inp)
 
@@ -125,7 +127,7 @@ class Pickle(Encoding):
     def encode(self, obj: Any) -> bytes:
         return pickle.dumps(obj)
 
-    def decode(self, data: bytes) -> Any:
+    def decode(self, data: Union[bytes, memoryview]) -> Any:
         return pickle.loads(data)
 
 
@@ -135,8 +137,8 @@ class JSON(Encoding):
     def encode(self, obj: Any) -> bytes:
         return json.dumps(obj).encode('utf-8')
 
-    def decode(self, data: bytes) -> Any:
-        return json.loads(data.decode('utf-8'))
+    def decode(self, data: Union[bytes, memoryview]) -> Any:
+        return json.loads(str(data, 'utf-8'))
 
 
 # Encodings (name -> class).
@@ -189,12 +191,12 @@ def mds_encode(encoding: str, obj: Any) -> bytes:
     return cls().encode(obj)
 
 
-def mds_decode(encoding: str, data: bytes) -> Any:
+def mds_decode(encoding: str, data: Union[bytes, memoryview]) -> Any:
     """Decode the given data from bytes to the original object.
 
     Args:
         encoding (str): Encoding.
-        data (bytes): Encoded data.
+        data (Union[bytes, memoryview]): Encoded data.
 
     Returns:
         Any: Decoded object.
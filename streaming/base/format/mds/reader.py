@@ -1,13 +1,17 @@
-from copy import deepcopy
-import numpy as np
-import os
-from typing import Any, Optional
+from collections.abc import Mapping
+from struct import Struct
+from typing import Any, Iterator, Optional, Union
 from typing_extensions import Self
 
-from ..base.reader import FileInfo, JointReader
+from ..base.reader import FileInfo, FileTable, JointReader
 from .encodings import mds_decode
 
 
+# Decoders for the uint32 column sizes and sample offset pairs found in MDS shards.
+_uint32 = Struct('<I')
+_uint32_pair = Struct('<2I')
+
+
 '''
     {
       "column_encodings": [
@@ -51,6 +55,62 @@ from .encodings import mds_decode
 '''
 
 
+class LazySample(Mapping):
+    """An MDS sample whose fields are decoded from the sample data on first access.
+
+    Args:
+        data (bytes): The sample encoded as bytes.
+        offsets (list[int]): Where each column's value begins, followed by where the last ends.
+        column_indices (dict[str, int]): Mapping of column name to column index.
+        column_encodings (list[str]): Column encodings.
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        offsets: list[int],
+        column_indices: dict[str, int],
+        column_encodings: list[str]
+    ) -> None:
+        self.data = data
+        self.offsets = offsets
+        self.column_indices = column_indices
+        self.column_encodings = column_encodings
+        self._values = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of a field, decoding it if not already decoded.
+
+        Args:
+            key (str): Column name.
+
+        Returns:
+            Any: Field value.
+        """
+        if key in self._values:
+            return self._values[key]
+        idx = self.column_indices[key]
+        value = self.data[self.offsets[idx]:self.offsets[idx + 1]]
+        self._values[key] = value = mds_decode(self.column_encodings[idx], value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the column names.
+
+        Returns:
+            Iterator[str]: Iterator over column names.
+        """
+        return iter(self.column_indices)
+
+    def __len__(self) -> int:
+        """Get the number of columns.
+
+        Returns:
+            int: Column count.
+        """
+        return len(self.column_indices)
+
+
 class MDSReader(JointReader):
     """Provides random access to the samples of an MDS shard.
 
@@ -88,45 +148,68 @@ class MDSReader(JointReader):
         self.column_encodings = column_encodings
         self.column_names = column_names
         self.column_sizes = column_sizes
+        self._column_indices = {name: idx for idx, name in enumerate(column_names)}
 
     @classmethod
-    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any]) -> Self:
-        args = deepcopy(obj)
-        assert args['version'] == 2
+    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any],
+                  files: Optional[FileTable] = None) -> Self:
+        assert obj['version'] == 2
+        assert obj['format'] == 'mds'
+        args = dict(obj)
         del args['version']
-        assert args['format'] == 'mds'
         del args['format']
         args['dirname'] = dirname
         args['split'] = split
+        if files is None:
+            files = FileTable()
         for key in ['raw_data', 'zip_data']:
             arg = args[key]
-            args[key] = FileInfo(**arg) if arg else None
+            args[key] = files.append(**arg) if arg else None
         return cls(**args)
 
-    def _decode_sample(self, data: bytes) -> dict[str, Any]:
+    def _get_column_offsets(self, data: Union[bytes, memoryview]) -> list[int]:
+        """Get where each column's value begins within the sample data (then where the last ends).
+
+        Args:
+            data (Union[bytes, memoryview]): The sample encoded as bytes.
+
+        Returns:
+            list[int]: Column value offsets.
+        """
         sizes = []
         idx = 0
-        for key, size in zip(self.column_names, self.column_sizes):
+        for size in self.column_sizes:
             if size:
                 sizes.append(size)
             else:
-                size, = np.frombuffer(data[idx:idx + 4], np.uint32)
+                size, = _uint32.unpack_from(data, idx)
                 sizes.append(size)
                 idx += 4
+        offsets = [idx]
+        for size in sizes:
+            idx += size
+            offsets.append(idx)
+        return offsets
+
+    def _decode_sample(self, data: Union[bytes, memoryview]) -> dict[str, Any]:
+        data = memoryview(data)  # Field slices are views; decoders copy out what they keep.
+        offsets = self._get_column_offsets(data)
         sample = {}
-        for key, encoding, size in zip(self.column_names, self.column_encodings, sizes):
-            value = data[idx:idx + size]
+        for idx, (key, encoding) in enumerate(zip(self.column_names, self.column_encodings)):
+            value = data[offsets[idx]:offsets[idx + 1]]
             sample[key] = mds_decode(encoding, value)
-            idx += size
         return sample
 
-    def _get_sample_data(self, idx: int) -> bytes:
-        filename = os.path.join(self.dirname, self.split, self.raw_data.basename)
+    def _decode_lazy_sample(self, data: Union[bytes, memoryview]) -> LazySample:
+        data = bytes(data)  # Fields are decoded later, after any read buffer has been reused.
+        offsets = self._get_column_offsets(data)
+        return LazySample(data, offsets, self._column_indices, self.column_encodings)
+
+    def _get_sample_data(self, idx: int) -> memoryview:
         offset = (1 + idx) * 4
-        with open(filename, 'rb', 0) as fp:
+        with open(self._data_filename, 'rb', 0) as fp:
             fp.seek(offset)
             pair = fp.read(8)
-            begin, end = np.frombuffer(pair, np.uint32)
+            begin, end = _uint32_pair.unpack(pair)
             fp.seek(begin)
-            data = fp.read(end - begin)
-        return data
+            return self._read_into_buffer(fp, end - begin)
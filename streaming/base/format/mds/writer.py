@@ -1,7 +1,8 @@
-import json
 import numpy as np
+from struct import Struct
 from typing import Any, Optional
 
+from ...jsonio import dumps
 from ..base.writer import JointWriter
 from .encodings import get_mds_encoded_size, is_mds_encoding, mds_encode
 
@@ -24,23 +25,25 @@ class MDSWriter(JointWriter):
         self.column_names = []
         self.column_encodings = []
         self.column_sizes = []
-        for name in sorted(columns):
-            encoding = columns[name]
+        for name, encoding in columns.items():  # Stored in the given order, recorded in config.
             assert is_mds_encoding(encoding)
             size = get_mds_encoded_size(encoding)
             self.column_names.append(name)
             self.column_encodings.append(encoding)
             self.column_sizes.append(size)
 
+        # Packs the sizes of the variable-size columns, which lead each encoded sample.
+        num_dynamic = self.column_sizes.count(None)
+        self._head = Struct(f'<{num_dynamic}I')
+
         obj = self._get_config()
-        text = json.dumps(obj, sort_keys=True)
-        self.config_data = text.encode('utf-8')
+        self.config_data = dumps(obj)
         self.extra_bytes_per_shard = 4 + 4 + len(self.config_data)
         self._reset_cache()
 
     def _encode_sample(self, sample: dict[str, Any]) -> bytes:
         sizes = []
-        data = []
+        data = [b'']
         for key, encoding, size in zip(self.column_names, self.column_encodings, self.column_sizes):
             value = sample[key]
             datum = mds_encode(encoding, value)
@@ -50,9 +53,8 @@ class MDSWriter(JointWriter):
             else:
                 assert size == len(datum)
             data.append(datum)
-        head = np.array(sizes, np.uint32).tobytes()
-        body = b''.join(data)
-        return head + body
+        data[0] = self._head.pack(*sizes)
+        return b''.join(data)
 
     def _get_config(self) -> dict[str, Any]:
         obj = super()._get_config()
@@ -63,10 +65,10 @@ class MDSWriter(JointWriter):
         })
         return obj
 
-    def _encode_joint_shard(self) -> bytes:
+    def _encode_joint_shard(self) -> list[bytes]:
         num_samples = np.uint32(len(self.new_samples))
-        sizes = list(map(len, self.new_samples))
-        offsets = np.array([0] + sizes).cumsum().astype(np.uint32)
-        offsets += len(num_samples.tobytes()) + len(offsets.tobytes()) + len(self.config_data)
-        sample_data = b''.join(self.new_samples)
-        return num_samples.tobytes() + offsets.tobytes() + self.config_data + sample_data
+        offsets = np.zeros(num_samples + 1, np.uint32)
+        offsets[1:] = np.fromiter(map(len, self.new_samples), np.uint32, num_samples)
+        np.cumsum(offsets, out=offsets)
+        offsets += num_samples.nbytes + offsets.nbytes + len(self.config_data)
+        return [num_samples.tobytes(), offsets.tobytes(), self.config_data] + self.new_samples
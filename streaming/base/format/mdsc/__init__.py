@@ -0,0 +1,5 @@
+from .reader import MDSCReader
+from .writer import MDSCWriter
+
+
+__all__ = ['MDSCReader', 'MDSCWriter']
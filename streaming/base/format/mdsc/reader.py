@@ -0,0 +1,171 @@
+import numpy as np
+from struct import Struct
+from typing import Any, Optional
+from typing_extensions import Self
+
+from ..base.reader import FileInfo, FileTable
+from ..mds.encodings import mds_decode
+from ..mds.reader import MDSReader
+
+
+# Decoder for the value offset pairs of variable-size columns.
+_uint32_pair = Struct('<2I')
+
+
+'''
+    {
+      "column_encodings": [
+        "int",
+        "str"
+      ],
+      "column_names": [
+        "number",
+        "words"
+      ],
+      "column_sizes": [
+        8,
+        null
+      ],
+      "compression": "zstd:7",
+      "format": "mdsc",
+      "hashes": [
+        "sha1",
+        "xxh3_64"
+      ],
+      "raw_data": {
+        "basename": "shard.00000.mdsc",
+        "bytes": 1048556,
+        "hashes": {
+          "sha1": "...",
+          "xxh3_64": "..."
+        }
+      },
+      "samples": 16621,
+      "size_limit": 1048576,
+      "version": 2,
+      "zip_data": {
+        "basename": "shard.00000.mdsc.zstd",
+        "bytes": 219814,
+        "hashes": {
+          "sha1": "...",
+          "xxh3_64": "..."
+        }
+      }
+    }
+'''
+
+
+class MDSCReader(MDSReader):
+    """Provides random access to the samples of an MDSC (column-major MDS) shard.
+
+    Each column is read from its own region of the shard, so a subset of a sample's columns can be
+    fetched with ``get_columns`` without reading the others.
+
+    Args:
+        dirname (str): Local dataset directory.
+        split (Optional[str]): Which dataset split to use, if any.
+        column_encodings (list[str]): Column encodings.
+        column_names (list[str]): Column names.
+        column_sizes (list[Optional[int]]): Column fixed sizes, if any.
+        compression (Optional[str]): Optional compression or compression:level.
+        hashes (list[str]): Optional list of hash algorithms to apply to shard files.
+        raw_data (FileInfo): Uncompressed data file info.
+        samples (int): Number of samples in this shard.
+        size_limit (Optional[int]): Optional shard size limit, after which point to start a new
+            shard. If None, puts everything in one shard.
+        zip_data (FileInfo): Compressed data file info.
+    """
+
+    def __init__(
+        self,
+        dirname: str,
+        split: Optional[str],
+        column_encodings: list[str],
+        column_names: list[str],
+        column_sizes: list[Optional[int]],
+        compression: Optional[str],
+        hashes: list[str],
+        raw_data: FileInfo,
+        samples: int,
+        size_limit: Optional[int],
+        zip_data: FileInfo
+    ) -> None:
+        super().__init__(dirname, split, column_encodings, column_names, column_sizes, compression,
+                         hashes, raw_data, samples, size_limit, zip_data)
+
+        # Where each column's region begins, loaded from the shard on first sample access.
+        self._column_offsets = None
+
+    @classmethod
+    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any],
+                  files: Optional[FileTable] = None) -> Self:
+        assert obj['version'] == 2
+        assert obj['format'] == 'mdsc'
+        args = dict(obj)
+        del args['version']
+        del args['format']
+        args['dirname'] = dirname
+        args['split'] = split
+        if files is None:
+            files = FileTable()
+        for key in ['raw_data', 'zip_data']:
+            arg = args[key]
+            args[key] = files.append(**arg) if arg else None
+        return cls(**args)
+
+    def _open(self) -> None:
+        if self._column_offsets is not None:
+            return
+        with open(self._data_filename, 'rb', 0) as fp:
+            fp.seek(4)
+            data = fp.read((len(self.column_names) + 1) * 4)
+        self._column_offsets = np.frombuffer(data, np.uint32).tolist()
+
+    def _get_sample_columns(self, idx: int, columns: list[int]) -> list[bytes]:
+        """Get the raw values of some of the columns of the sample at the index.
+
+        Args:
+            idx (int): Sample index.
+            columns (list[int]): Column indices.
+
+        Returns:
+            list[bytes]: Encoded value of each column.
+        """
+        self._open()
+        values = []
+        with open(self._data_filename, 'rb', 0) as fp:
+            for column in columns:
+                begin = self._column_offsets[column]
+                size = self.column_sizes[column]
+                if size:
+                    begin += idx * size
+                else:
+                    fp.seek(begin + idx * 4)
+                    begin, end = _uint32_pair.unpack(fp.read(8))
+                    size = end - begin
+                fp.seek(begin)
+                values.append(fp.read(size))
+        return values
+
+    def _get_sample_data(self, idx: int) -> bytes:
+        values = self._get_sample_columns(idx, list(range(len(self.column_names))))
+        sizes = [len(value) for value, size in zip(values, self.column_sizes) if not size]
+        head = np.array(sizes, '<u4').tobytes()
+        return b''.join([head] + values)
+
+    def get_columns(self, idx: int, names: list[str]) -> dict[str, Any]:
+        """Get only the given columns of the sample at the index, reading none of the others.
+
+        Args:
+            idx (int): Sample index.
+            names (list[str]): Column names.
+
+        Returns:
+            dict[str, Any]: Partial sample dict.
+        """
+        columns = [self._column_indices[name] for name in names]
+        values = self._get_sample_columns(idx, columns)
+        sample = {}
+        for name, column, value in zip(names, columns, values):
+            sample[name] = mds_decode(self.column_encodings[column], value)
+        return sample
@@ -0,0 +1,78 @@
+import numpy as np
+from typing import Optional
+
+from ..mds.writer import MDSWriter
+
+
+class MDSCWriter(MDSWriter):
+    """Writes a streaming dataset in MDSC format (MDS, but stored column by column).
+
+    Shard layout: [num samples: 4] [column offsets: 4 * (num columns + 1)] [config] then each
+    column's region. Fixed-size columns store their values back to back. Variable-size columns
+    store (num samples + 1) uint32 value offsets, followed by the values.
+
+    Args:
+        dirname (str): Local dataset directory.
+        columns (dict[str, str]): Mapping of column name to MDS encoding.
+        compression (Optional[str], default: None): Optional compression or compression:level.
+        hashes (Optional[list[str]], default: None): Optional list of hash algorithms to apply to
+            shard files.
+        size_limit (Optional[int], default: 1 << 26): Optional shard size limit, after which point
+            to start a new shard. If None, puts everything in one shard.
+    """
+
+    format = 'mdsc'
+    extra_bytes_per_sample = 0
+
+    def __init__(
+        self,
+        dirname: str,
+        columns: dict[str, str],
+        compression: Optional[str] = None,
+        hashes: Optional[list[str]] = None,
+        size_limit: Optional[int] = 1 << 26
+    ) -> None:
+        super().__init__(dirname, columns, compression, hashes, size_limit)
+
+        # Per-sample variable-size column offsets take the place of the size head of each cached
+        # sample, leaving one extra offset per variable-size column per shard.
+        num_columns = len(self.column_names)
+        num_dynamic = self.column_sizes.count(None)
+        self.extra_bytes_per_shard = 4 + 4 * (num_columns + 1) + len(self.config_data) + \
+            4 * num_dynamic
+        self._reset_cache()
+
+    def _encode_joint_shard(self) -> list[bytes]:
+        num_samples = len(self.new_samples)
+        num_columns = len(self.column_names)
+
+        # Split the cached samples (encoded as MDS) into their columns.
+        columns = [[] for _ in range(num_columns)]
+        for sample in self.new_samples:
+            sizes = iter(self._head.unpack_from(sample))
+            idx = self._head.size
+            for values, size in zip(columns, self.column_sizes):
+                size = size or next(sizes)
+                values.append(sample[idx:idx + size])
+                idx += size
+
+        # Lay out the column regions one after another, following the header.
+        column_offsets = np.zeros(num_columns + 1, np.uint32)
+        begin = 4 + column_offsets.nbytes + len(self.config_data)
+        regions = []
+        for idx, (values, size) in enumerate(zip(columns, self.column_sizes)):
+            column_offsets[idx] = begin
+            if size:
+                begin += size * num_samples
+            else:
+                offsets = np.zeros(num_samples + 1, np.uint32)
+                offsets[1:] = np.fromiter(map(len, values), np.uint32, num_samples)
+                np.cumsum(offsets, out=offsets)
+                offsets += begin + offsets.nbytes
+                regions.append(offsets.tobytes())
+                begin = int(offsets[-1])
+            regions += values
+        column_offsets[-1] = begin
+
+        head = [np.uint32(num_samples).tobytes(), column_offsets.tobytes(), self.config_data]
+        return head + regions
@@ -1,7 +1,8 @@
-from typing import Any
+from typing import Any, Callable
 
 
-__all__ = ['is_xsv_encoding', 'xsv_decode', 'xsv_encode']
+__all__ = ['get_xsv_decoder', 'get_xsv_encoder', 'is_xsv_encoding', 'xsv_decode',
+           'xsv_encode']
 
 
 class Encoding(object):
@@ -116,3 +117,29 @@ def xsv_decode(encoding: str, value: str) -> Any:
     """
     cls = _encodings[encoding]
     return cls.decode(value)
+
+
+def get_xsv_encoder(encoding: str) -> Callable[[Any], str]:
+    """Get the function that encodes objects of this encoding, to call directly per value.
+
+    Args:
+        encoding (str): The encoding.
+
+    Returns:
+        Callable[[Any], str]: Encoding function.
+    """
+    cls = _encodings[encoding]
+    return cls.encode
+
+
+def get_xsv_decoder(encoding: str) -> Callable[[str], Any]:
+    """Get the function that decodes objects of this encoding, to call directly per value.
+
+    Args:
+        encoding (str): The encoding.
+
+    Returns:
+        Callable[[str], Any]: Decoding function.
+    """
+    cls = _encodings[encoding]
+    return cls.decode
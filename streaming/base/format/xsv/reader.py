@@ -1,12 +1,9 @@
-from copy import deepcopy
-import json
 import numpy as np
-import os
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from typing_extensions import Self
 
-from ..base.reader import FileInfo, SplitReader
-from .encodings import xsv_decode
+from ..base.reader import FileInfo, FileTable, SplitReader
+from .encodings import get_xsv_decoder
 
 '''
     {
@@ -110,41 +107,52 @@ class XSVReader(SplitReader):
         self.newline = newline
         self.separator = separator
 
+        # Per-column decode functions, resolved once instead of looked up per value.
+        self._decoders = list(map(get_xsv_decoder, column_encodings))
+
     @classmethod
-    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any]) -> Self:
-        args = deepcopy(obj)
-        assert args['version'] == 2
+    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any],
+                  files: Optional[FileTable] = None) -> Self:
+        assert obj['version'] == 2
+        assert obj['format'] == 'xsv'
+        args = dict(obj)
         del args['version']
-        assert args['format'] == 'xsv'
         del args['format']
         args['dirname'] = dirname
         args['split'] = split
+        if files is None:
+            files = FileTable()
         for key in ['raw_data', 'raw_meta', 'zip_data', 'zip_meta']:
             arg = args[key]
-            args[key] = FileInfo(**arg) if arg else None
+            args[key] = files.append(**arg) if arg else None
         return cls(**args)
 
-    def _decode_sample(self, data: bytes) -> dict[str, Any]:
-        text = data.decode('utf-8')
+    def _decode_sample(self, data: Union[bytes, memoryview]) -> dict[str, Any]:
+        text = str(data, 'utf-8')
         text = text[:-len(self.newline)]
         parts = text.split(self.separator)
-        sample = {}
-        for name, encoding, part in zip(self.column_names, self.column_encodings, parts):
-            sample[name] = xsv_decode(encoding, part)
-        return sample
+        return {
+            name: decode(part)
+            for name, decode, part in zip(self.column_names, self._decoders, parts)
+        }
 
-    def _get_sample_data(self, idx: int) -> bytes:
-        meta_filename = os.path.join(self.dirname, self.split, self.raw_meta.basename)
-        offset = (1 + idx) * 4
-        with open(meta_filename, 'rb', 0) as fp:
-            fp.seek(offset)
-            pair = fp.read(8)
-            begin, end = np.frombuffer(pair, np.uint32)
-        data_filename = os.path.join(self.dirname, self.split, self.raw_data.basename)
-        with open(data_filename, 'rb', 0) as fp:
+    def _get_sample_data(self, idx: int) -> memoryview:
+        self._open()
+        begin, end = self._offsets[idx:idx + 2].tolist()
+        with open(self._data_filename, 'rb', 0) as fp:
             fp.seek(begin)
-            data = fp.read(end - begin)
-        return data
+            return self._read_into_buffer(fp, end - begin)
+
+    def get_batch(self, indices: list[int]) -> list[dict[str, Any]]:
+        self._open()
+        batch = [None] * len(indices)
+        with open(self._data_filename, 'rb', 0) as fp:
+            for i in np.argsort(indices, kind='stable'):
+                begin, end = self._offsets[indices[i]:indices[i] + 2].tolist()
+                fp.seek(begin)
+                data = self._read_into_buffer(fp, end - begin)
+                batch[i] = self._decode_sample(data)
+        return batch
 
 
 class CSVReader(XSVReader):
@@ -190,17 +198,20 @@ class CSVReader(XSVReader):
                          zip_meta)
 
     @classmethod
-    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any]) -> Self:
-        args = deepcopy(obj)
-        assert args['version'] == 2
+    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any],
+                  files: Optional[FileTable] = None) -> Self:
+        assert obj['version'] == 2
+        assert obj['format'] == 'csv'
+        args = dict(obj)
         del args['version']
-        assert args['format'] == 'csv'
         del args['format']
         args['dirname'] = dirname
         args['split'] = split
+        if files is None:
+            files = FileTable()
         for key in ['raw_data', 'raw_meta', 'zip_data', 'zip_meta']:
             arg = args[key]
-            args[key] = FileInfo(**arg) if arg else None
+            args[key] = files.append(**arg) if arg else None
         return cls(**args)
 
 
@@ -247,15 +258,18 @@ class TSVReader(XSVReader):
                          zip_meta)
 
     @classmethod
-    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any]) -> Self:
-        args = deepcopy(obj)
-        assert args['version'] == 2
+    def from_json(cls, dirname: str, split: Optional[str], obj: dict[str, Any],
+                  files: Optional[FileTable] = None) -> Self:
+        assert obj['version'] == 2
+        assert obj['format'] == 'tsv'
+        args = dict(obj)
         del args['version']
-        assert args['format'] == 'tsv'
         del args['format']
         args['dirname'] = dirname
         args['split'] = split
+        if files is None:
+            files = FileTable()
         for key in ['raw_data', 'raw_meta', 'zip_data', 'zip_meta']:
             arg = args[key]
-            args[key] = FileInfo(**arg) if arg else None
+            args[key] = files.append(**arg) if arg else None
         return cls(**args)
@@ -1,9 +1,41 @@
-import json
 import numpy as np
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+from ...jsonio import dumps
 from ..base.writer import SplitWriter
-from .encodings import is_xsv_encoding, xsv_encode
+from .encodings import get_xsv_encoder, is_xsv_encoding
+
+
+def _build_encoder(column_names: list[str], column_encodings: list[str], separator: str,
+                   newline: str) -> Callable[[dict[str, Any]], bytes]:
+    """Generate a sample encoding function specialized to the given columns.
+
+    The per-column loop is unrolled into straight-line code, so encoding a sample does no lookups
+    beyond fetching each value. The separator/newline checks are asserts, which ``python -O``
+    strips.
+
+    Args:
+        column_names (list[str]): Column names.
+        column_encodings (list[str]): Column encodings.
+        separator (str): Separator character(s).
+        newline (str): Newline character(s).
+
+    Returns:
+        Callable[[dict[str, Any]], bytes]: Function that encodes a sample dict to bytes.
+    """
+    namespace = {'separator': separator, 'newline': newline}
+    lines = ['def encode(sample):']
+    values = []
+    for idx, (name, encoding) in enumerate(zip(column_names, column_encodings)):
+        namespace[f'encode_{idx}'] = get_xsv_encoder(encoding)
+        lines.append(f'    value_{idx} = encode_{idx}(sample[{name!r}])')
+        lines.append(f'    assert newline not in value_{idx} and separator not in value_{idx}')
+        values.append(f'value_{idx}')
+    text = ' + separator + '.join(values) or "''"
+    lines.append(f"    return ({text} + newline).encode('utf-8')")
+    source = '\n'.join(lines) + '\n'
+    exec(compile(source, '<xsv encoder>', 'exec'), namespace)
+    return namespace['encode']
 
 
 class XSVWriter(SplitWriter):
@@ -24,8 +56,7 @@ class XSVWriter(SplitWriter):
         self.columns = columns
         self.column_names = []
         self.column_encodings = []
-        for name in sorted(columns):
-            encoding = columns[name]
+        for name, encoding in columns.items():  # Stored in the given order, recorded in config.
             assert newline not in name
             assert separator not in name
             assert is_xsv_encoding(encoding)
@@ -35,15 +66,10 @@ class XSVWriter(SplitWriter):
         self.separator = separator
         self.newline = newline
 
+        self._encoder = _build_encoder(self.column_names, self.column_encodings, separator, newline)
+
     def _encode_sample(self, sample: dict[str, Any]) -> bytes:
-        values = []
-        for name, encoding in zip(self.column_names, self.column_encodings):
-            value = xsv_encode(encoding, sample[name])
-            assert self.newline not in value
-            assert self.separator not in value
-            values.append(value)
-        text = self.separator.join(values) + self.newline
-        return text.encode('utf-8')
+        return self._encoder(sample)
 
     def _get_config(self) -> dict[str, Any]:
         obj = super()._get_config()
@@ -55,18 +81,19 @@ class XSVWriter(SplitWriter):
         })
         return obj
 
-    def _encode_split_shard(self) -> tuple[bytes, bytes]:
+    def _encode_split_shard(self) -> tuple[list[bytes], list[bytes]]:
         header = self.separator.join(self.column_names) + self.newline
         header = header.encode('utf-8')
-        data = b''.join([header] + self.new_samples)
+        data = [header] + self.new_samples
         header_offset = len(header)
 
         num_samples = np.uint32(len(self.new_samples))
-        sizes = list(map(len, self.new_samples))
-        offsets = header_offset + np.array([0] + sizes).cumsum().astype(np.uint32)
+        offsets = np.zeros(num_samples + 1, np.uint32)
+        offsets[1:] = np.fromiter(map(len, self.new_samples), np.uint32, num_samples)
+        np.cumsum(offsets, out=offsets)
+        offsets += header_offset
         obj = self._get_config()
-        text = json.dumps(obj, sort_keys=True)
-        meta = num_samples.tobytes() + offsets.tobytes() + text.encode('utf-8')
+        meta = [num_samples.tobytes(), offsets.tobytes(), dumps(obj)]
 
         return data, meta
 
@@ -1,4 +1,4 @@
-from .hashing import get_hash, get_hashes, is_hash
+from .hashing import get_file_hash, get_hash, get_hash_of_parts, get_hashes, is_hash
 
 
-__all__ = ['get_hash', 'get_hashes', 'is_hash']
+__all__ = ['get_file_hash', 'get_hash', 'get_hash_of_parts', 'get_hashes', 'is_hash']
@@ -3,7 +3,7 @@ from typing import Any, Callable
 import xxhash
 
 
-__all__ = ['get_hash', 'get_hashes', 'is_hash']
+__all__ = ['get_file_hash', 'get_hash', 'get_hash_of_parts', 'get_hashes', 'is_hash']
 
 
 def _collect() -> dict[str, Callable[[bytes], Any]]:
@@ -59,3 +59,46 @@ def get_hash(algo: str, data: bytes) -> str:
     """
     func = _hashes[algo]
     return func(data).hexdigest()
+
+
+def get_hash_of_parts(algo: str, parts: list[bytes]) -> str:
+    """Apply the hash algorithm to the concatenation of the parts, without concatenating them.
+
+    Args:
+        algo (str): Hash algorithm.
+        parts (list[bytes]): Data to hash, in pieces.
+
+    Returns:
+        str: Hex digest.
+    """
+    func = _hashes[algo]
+    obj = func()
+    for part in parts:
+        obj.update(part)
+    return obj.hexdigest()
+
+
+def get_file_hash(algo: str, filename: str) -> str:
+    """Apply the hash algorithm to a file's contents, streaming it instead of reading it whole.
+
+    Uses ``hashlib.file_digest`` where available (Python 3.11+), which hashes through a reused
+    buffer with the GIL released, so files can be hashed in parallel threads.
+
+    Args:
+        algo (str): Hash algorithm.
+        filename (str): Path to the file.
+
+    Returns:
+        str: Hex digest.
+    """
+    func = _hashes[algo]
+    with open(filename, 'rb') as fp:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(fp, func).hexdigest()
+        obj = func()
+        while True:
+            chunk = fp.read(1 << 20)
+            if not chunk:
+                break
+            obj.update(chunk)
+        return obj.hexdigest()
@@ -49,7 +49,8 @@ class Index(object):
     def __init__(self, samples_per_shard: list[int], batch_size: Optional[int] = None) -> None:
         self.total_samples = sum(samples_per_shard)
         self.samples_per_shard = samples_per_shard
-        self.shard_offsets = np.array([0] + samples_per_shard).cumsum().tolist()
+        self._shard_offsets = np.array([0] + samples_per_shard, np.int64).cumsum()
+        self.shard_offsets = self._shard_offsets.tolist()
 
         self.batch_size = batch_size
 
@@ -62,27 +63,24 @@ class Index(object):
         Returns:
             tuple[int, int]: Shard and sample index within that shard.
         """
-        low = 0
-        high = len(self.shard_offsets) - 1
-        while True:
-            if low + 1 == high:
-                if idx == self.shard_offsets[high]:
-                    shard = high
-                else:
-                    shard = low
-                break
-            mid = (low + high) // 2
-            div = self.shard_offsets[mid]
-            if idx < div:
-                high = mid
-            elif div < idx:
-                low = mid
-            else:
-                shard = mid
-                break
+        shard = int(np.searchsorted(self._shard_offsets, idx, 'right')) - 1
         offset = idx - self.shard_offsets[shard]
         return shard, offset
 
+    def find_samples(self, idxs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get the shards and offsets where many samples will be found, in one pass.
+
+        Args:
+            idxs (np.ndarray): Global sample indices.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Shards and sample indices within those shards.
+        """
+        idxs = np.asarray(idxs, np.int64)
+        shards = np.searchsorted(self._shard_offsets, idxs, 'right') - 1
+        offsets = idxs - self._shard_offsets[shards]
+        return shards, offsets
+
     def get_samples_per_device(self) -> int:
         """Get the per-device dataset size (i.e., IterableDataset.__len__).
 
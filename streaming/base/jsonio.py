@@ -0,0 +1,44 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+__all__ = ['dumps', 'loads']
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to canonical (compact, sorted keys) UTF-8 JSON.
+
+    Uses orjson if it is installed, otherwise falls back to the standard library with the same
+    output format.
+
+    Args:
+        obj (Any): The object.
+
+    Returns:
+        bytes: JSON data.
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    return text.encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize an object from UTF-8 JSON.
+
+    Uses orjson if it is installed, otherwise falls back to the standard library.
+
+    Args:
+        data (bytes): JSON data.
+
+    Returns:
+        Any: The object.
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,10 +1,11 @@
-import json
 import os
 from torch.utils.data import Dataset
 from typing import Any, Optional
 
 from .format import reader_from_json
+from .format.base.reader import FileTable
 from .index import Index
+from .jsonio import loads
 
 
 class LocalDataset(Dataset):
@@ -15,12 +16,13 @@ class LocalDataset(Dataset):
         self.split = split
 
         filename = os.path.join(dirname, split, 'index.json')
-        obj = json.load(open(filename))
+        obj = loads(open(filename, 'rb').read())
         assert obj['version'] == 2
 
+        self.files = FileTable()
         self.shards = []
         for info in obj['shards']:
-            shard = reader_from_json(dirname, split, info)
+            shard = reader_from_json(dirname, split, info, self.files)
             self.shards.append(shard)
 
         shard_sizes = list(map(lambda x: x.samples, self.shards))
@@ -1,7 +1,12 @@
 import numpy as np
+import os
+import pickle
+import resource
 from shutil import rmtree
 
-from streaming.base import CSVWriter, Dataset, JSONWriter, MDSWriter, TSVWriter
+from streaming.base import CSVWriter, Dataset, JSONWriter, MDSCWriter, MDSWriter, TSVWriter
+from streaming.base.format.mdsc import MDSCReader
+from streaming.base.index import Index
 
 
 ones = ('zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen ' +
@@ -46,6 +51,66 @@ def get_dataset(num_samples):
     return samples
 
 
+def test_index():
+    """Check sample lookup against a brute force expansion, including layouts with empty shards."""
+    layouts = [
+        [5, 3, 7],
+        [1],
+        [0, 4, 0, 0, 2, 0],
+        [3, 0],
+        [0, 3],
+        list(np.random.randint(0, 4, 100)) + [1],
+    ]
+    for samples_per_shard in layouts:
+        samples_per_shard = list(map(int, samples_per_shard))
+        gold = []
+        for shard, samples in enumerate(samples_per_shard):
+            gold += [(shard, offset) for offset in range(samples)]
+        index = Index(samples_per_shard)
+        assert [index.find_sample(i) for i in range(len(gold))] == gold
+        shards, offsets = index.find_samples(np.arange(len(gold)))
+        assert list(zip(shards.tolist(), offsets.tolist())) == gold
+
+
+def count_open_files():
+    return len(os.listdir('/proc/self/fd'))
+
+
+def test_many_shards(samples):
+    """Iterate datasets of many small shards, checking that open files do not pile up per shard."""
+    columns = {
+        'number': 'int',
+        'words': 'str',
+    }
+    size_limit = 1 << 10
+
+    writers = [
+        (MDSWriter, '/tmp/mds'),
+        (MDSCWriter, '/tmp/mdsc'),
+        (CSVWriter, '/tmp/csv'),
+        (TSVWriter, '/tmp/tsv'),
+        (JSONWriter, '/tmp/json'),
+    ]
+    for writer_class, dirname in writers:
+        with writer_class(dirname, columns, None, None, size_limit) as out:
+            for x in samples:
+                out.write(x)
+
+        dataset = Dataset(dirname, shuffle=False)
+        assert 256 < len(dataset.shards)
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(256, hard), hard))
+        try:
+            before = count_open_files()
+            for gold, test in zip(samples, dataset):
+                assert gold == test
+            assert count_open_files() <= before + 16
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+        rmtree(dirname)
+
+
 def main():
     samples = get_dataset(100_000)
 
@@ -61,6 +126,10 @@ def main():
         for x in samples:
             out.write(x)
 
+    with MDSCWriter('/tmp/mdsc', columns, compression, hashes, size_limit) as out:
+        for x in samples:
+            out.write(x)
+
     with CSVWriter('/tmp/csv', columns, compression, hashes, size_limit) as out:
         for x in samples:
             out.write(x)
@@ -73,13 +142,68 @@ def main():
         for x in samples:
             out.write(x)
 
-    for dirname in ['/tmp/mds', '/tmp/csv', '/tmp/tsv', '/tmp/json']:
+    for dirname in ['/tmp/mds', '/tmp/mdsc', '/tmp/csv', '/tmp/tsv', '/tmp/json']:
         dataset = Dataset(dirname, shuffle=False)
         for gold, test in zip(samples, dataset):
             assert gold == test
 
-    for dirname in ['/tmp/mds', '/tmp/csv', '/tmp/tsv', '/tmp/json']:
+        # MDSC shards can read just some columns, in any order.
+        for shard in dataset.shards:
+            if not isinstance(shard, MDSCReader):
+                continue
+            for i in [0, len(shard) // 2, len(shard) - 1]:
+                sample = shard[i]
+                for names in [['number'], ['words'], ['words', 'number']]:
+                    columns = shard.get_columns(i, names)
+                    assert list(columns.items()) == [(name, sample[name]) for name in names]
+
+        # Lazy samples must own their data, as later reads reuse the read buffer.
+        for shard in dataset.shards:
+            lazies = [(i, shard.get_lazy(i)) for i in [len(shard) - 1, 0, len(shard) // 2]]
+            shard[1]
+            for i, lazy in lazies:
+                assert dict(lazy) == shard[i]
+
+        # Batches are read in file order, but must come back in the order requested.
+        for shard in dataset.shards:
+            idxs = [len(shard) - 1, 3, 0, 3, len(shard) // 2, len(shard) - 1]
+            assert shard.get_batch(idxs) == [shard[i] for i in idxs]
+
+        # Prefetched iteration must match serial iteration, as must its serial fallback.
+        for shard in dataset.shards[:2]:
+            serial = list(shard)
+            assert list(shard.iter_prefetched(4)) == serial
+            assert list(shard.iter_prefetched(0)) == serial
+
+        # Datasets must survive pickling, as DataLoader workers may be spawned.
+        dataset = pickle.loads(pickle.dumps(Dataset(dirname, shuffle=False)))
+        for gold, test in zip(samples, dataset):
+            assert gold == test
+
+        # Iterating decompressed the shards, so now validate them as cached files.
+        dataset = Dataset(dirname, shuffle=False, hash='sha1')
+        for gold, test in zip(samples, dataset):
+            assert gold == test
+
+        # Corrupt a cached shard, which must fail validation.
+        filename = os.path.join(dirname, dataset.shards[0].raw_data.basename)
+        with open(filename, 'r+b') as fp:
+            byte = fp.read(1)
+            fp.seek(0)
+            fp.write(bytes([byte[0] ^ 0xFF]))
+        dataset = Dataset(dirname, shuffle=False, hash='sha1')
+        try:
+            next(iter(dataset))
+        except AssertionError:
+            pass
+        else:
+            raise RuntimeError('Corrupted shard passed validation.')
+
+    for dirname in ['/tmp/mds', '/tmp/mdsc', '/tmp/csv', '/tmp/tsv', '/tmp/json']:
         rmtree(dirname)
 
+    test_index()
+    test_many_shards(samples[:20_000])
+
 
 main()